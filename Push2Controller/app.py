@@ -37,6 +37,8 @@ class ShepherdPush2ControllerApp(ShepherdBackendControllerApp):
     available_midi_in_device_names = []
     notes_midi_in = None  # MIDI input device only used to receive note messages and illuminate pads/keys
     last_attempt_configuring_notes_in = 0
+    last_midi_in_device_names_scan_time = 0
+    midi_in_device_names_scan_ttl = 2  # Seconds a MIDI input port scan stays valid (see init_notes_midi_in)
 
     # push
     push = None
@@ -296,8 +298,15 @@ class ShepherdPush2ControllerApp(ShepherdBackendControllerApp):
 
     def init_notes_midi_in(self, device_name=None):
         print('Configuring notes MIDI in to {}...'.format(device_name))
-        self.available_midi_in_device_names = [name for name in mido.get_input_names() if
-                                               'Ableton Push' not in name and 'RtMidi' not in name and 'Through' not in name]
+        # Enumerating MIDI ports goes through the OS MIDI subsystem and is comparatively slow, and this
+        # method is retried every couple of seconds while no notes input is configured, so reuse the last
+        # scan results while they are still fresh
+        now = time.monotonic()
+        if not self.available_midi_in_device_names or \
+                now - self.last_midi_in_device_names_scan_time > self.midi_in_device_names_scan_ttl:
+            self.available_midi_in_device_names = [name for name in mido.get_input_names() if
+                                                   'Ableton Push' not in name and 'RtMidi' not in name and 'Through' not in name]
+            self.last_midi_in_device_names_scan_time = now
 
         if device_name is not None:
             try:
@@ -445,29 +454,36 @@ class ShepherdPush2ControllerApp(ShepherdBackendControllerApp):
     def run_loop(self):
         print('ShepherdController app loop is starting...')
         try:
+            # Frames are paced against absolute deadlines on the monotonic clock (immune to wall-clock
+            # adjustments): subtracting the measured draw time from the frame period would let per-frame
+            # jitter accumulate as drift, whereas advancing a deadline keeps the long-run rate exact
+            frame_period = 1.0 / self.target_frame_rate
+            next_frame_time = time.monotonic() + frame_period
             while True:
-                before_draw_time = time.time()
-
                 # Draw ui
                 self.update_push2_display()
 
+                # Check if any delayed actions need to be applied
+                self.check_for_delayed_actions()
+
+                after_draw_time = time.monotonic()
+
                 # Frame rate measurement
-                now = time.time()
                 self.current_frame_rate_measurement += 1
-                if time.time() - self.current_frame_rate_measurement_second > 1.0:
+                if after_draw_time - self.current_frame_rate_measurement_second > 1.0:
                     self.actual_frame_rate = self.current_frame_rate_measurement
                     self.current_frame_rate_measurement = 0
-                    self.current_frame_rate_measurement_second = now
+                    self.current_frame_rate_measurement_second = after_draw_time
 
-                # Check if any delayed actions need to be applied
-                self.check_for_delayed_actions()
-
-                after_draw_time = time.time()
-
-                # Calculate sleep time to aproximate the target frame rate
-                sleep_time = (1.0 / self.target_frame_rate) - (after_draw_time - before_draw_time)
+                # Sleep until the next frame deadline to aproximate the target frame rate
+                sleep_time = next_frame_time - after_draw_time
                 if sleep_time > 0:
                     time.sleep(sleep_time)
+                    next_frame_time += frame_period
+                else:
+                    # Fell behind (slow frame): resynchronize instead of trying to catch up with a
+                    # burst of undelayed frames
+                    next_frame_time = after_draw_time + frame_period
 
         except KeyboardInterrupt:
             print('Exiting ShepherdController...')
@@ -515,10 +531,12 @@ class ShepherdPush2ControllerApp(ShepherdBackendControllerApp):
             if track.input_monitoring:
                 hardware_device = track.get_output_hardware_device()
                 if hardware_device is not None:
-                    msg_type = 'note_on' if note_on else 'note_off'
                     channel = hardware_device.midi_channel - 1  # Convert from 1-16 to 0-15
-                    msg = mido.Message(msg_type, channel=channel, note=note, velocity=velocity)
-                    hardware_device.send_midi(msg)
+                    # Use the raw-bytes note send fast path, skipping mido.Message construction
+                    if note_on:
+                        hardware_device.send_note_on(note, velocity, channel=channel)
+                    else:
+                        hardware_device.send_note_off(note, velocity, channel=channel)
 
 
 # Bind push action handlers with class methods
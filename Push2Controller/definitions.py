@@ -6,7 +6,7 @@ import subprocess
 import sys
 import threading
 
-from functools import wraps
+from functools import lru_cache, wraps
 
 from push2_python.constants import ANIMATION_STATIC
 
@@ -58,10 +58,22 @@ LIME = 'lime'
 
 COLORS_NAMES = [ORANGE, YELLOW, TURQUOISE, LIME, RED, PINK, PURPLE, BLUE, CYAN, GREEN, BLACK, GRAY_DARK, GRAY_LIGHT, WHITE]
 
-def get_color_rgb(color_name):
-    return globals().get('{0}_RGB'.format(color_name.upper()), [0, 0, 0])
+_color_rgb_cache = {}
 
+def get_color_rgb(color_name):
+    # Drawing code resolves colors many times per frame, so cache resolved values and make every lookup
+    # after the first a single dict hit instead of a string format + globals() scan
+    try:
+        return _color_rgb_cache[color_name]
+    except KeyError:
+        rgb = globals().get('{0}_RGB'.format(color_name.upper()), [0, 0, 0])
+        _color_rgb_cache[color_name] = rgb
+        return rgb
+
+@lru_cache(maxsize=None)
 def get_color_rgb_float(color_name):
+    # Memoized because drawing helpers call this with the same few color names on every frame; callers
+    # only read/concatenate the result, so sharing the list is safe
     return [x/255 for x in get_color_rgb(color_name)]
 
 
@@ -111,6 +123,25 @@ FAVOURITE_PRESETS_FILE_PATH = os.path.join(BASE_DATA_DIR, 'favourite_presets.jso
 BUTTON_LONG_PRESS_TIME = 0.5
 BUTTON_DOUBLE_PRESS_TIME = 0.2
 
+# Shared "no mapping" notes/CC mapping payload (128 MIDI notes/CCs, -1 = not mapped). Built once so modes
+# clearing their backend mappings don't rebuild the same 128-entry list every time
+EMPTY_MIDI_MAPPING = [-1] * 128
+
+# Quantization step cycle used by the quantize actions (current step -> next step), and display labels
+# for each step. Precomputed tables so button handlers do a dict lookup instead of an if/elif chain
+NEXT_QUANTIZATION_STEP = {
+    0.0: 4.0/16.0,
+    4.0/16.0: 4.0/8.0,
+    4.0/8.0: 4.0/4.0,
+    4.0/4.0: 0.0,
+}
+QUANTIZATION_STEP_LABELS = {
+    4.0/16.0: '16th note',
+    4.0/8.0: '8th note',
+    4.0/4.0: '4th note',
+    0.0: 'no quantization',
+}
+
 
 # -- Timer for delayed actions
 
@@ -155,6 +186,7 @@ class ShepherdControllerMode(object):
     name = ''
     xor_group = None
     buttons_used = []
+    _buttons_used_set = None  # lazily built frozenset of buttons_used, for O(1) membership checks
 
     def __init__(self, app, settings=None):
         self.app = app
@@ -231,7 +263,11 @@ class ShepherdControllerMode(object):
             self.push.buttons.set_button_color(button_name, color, animation=animation, animation_end_color=animation_end_color)
 
     def set_buttons_need_update_if_button_used(self, button_name):
-        if button_name in self.buttons_used:
+        # This runs for every active mode on every button press/release, so check membership against
+        # a frozenset instead of scanning the buttons_used list each time
+        if self._buttons_used_set is None:
+            self._buttons_used_set = frozenset(self.buttons_used)
+        if button_name in self._buttons_used_set:
             self.app.buttons_need_update = True
 
     # Push2 action callbacks (these methods should return True if some action was carried out, otherwise return None)
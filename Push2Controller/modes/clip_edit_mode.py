@@ -147,9 +147,14 @@ class ClipEditMode(definitions.ShepherdControllerMode):
         return int(math.floor(8 * (beats - self.start_displayed_time)/(self.end_displayed_time - self.start_displayed_time)))
 
     def notes_to_pads(self):
-        notes = [event for event in self.clip.sequence_events if event.is_type_note() and 
-                                                                 (event.rendered_start_timestamp < self.end_displayed_time or event.rendered_end_timestamp > self.start_displayed_time) and
-                                                                 self.pads_min_note_offset <= event.midi_note < self.pads_min_note_offset + 8]
+        # Hoist the displayed window bounds out of the filter: start/end_displayed_time are computed
+        # properties that would otherwise be re-evaluated for every sequence event
+        start_displayed_time = self.start_displayed_time
+        end_displayed_time = self.end_displayed_time
+        min_displayed_note = self.pads_min_note_offset
+        notes = [event for event in self.clip.sequence_events if event.is_type_note() and
+                                                                 (event.rendered_start_timestamp < end_displayed_time or event.rendered_end_timestamp > start_displayed_time) and
+                                                                 min_displayed_note <= event.midi_note < min_displayed_note + 8]
         notes_to_display = []
         for event in notes:
             duration = event.rendered_end_timestamp - event.rendered_start_timestamp
@@ -195,17 +200,7 @@ class ClipEditMode(definitions.ShepherdControllerMode):
         return color_matrix, animation_matrix
 
     def quantize_helper(self):
-        current_quantization_step = self.clip.current_quantization_step
-        if (current_quantization_step == 0.0):
-            next_quantization_step = 4.0/16.0
-        elif (current_quantization_step == 4.0/16.0):
-            next_quantization_step = 4.0/8.0
-        elif (current_quantization_step == 4.0/8.0):
-            next_quantization_step = 4.0/4.0
-        elif (current_quantization_step == 4.0/4.0):
-            next_quantization_step = 0.0
-        else:
-            next_quantization_step = 0.0
+        next_quantization_step = definitions.NEXT_QUANTIZATION_STEP.get(self.clip.current_quantization_step, 0.0)
         self.clip.quantize(next_quantization_step)
 
     def set_new_generated_sequence(self):
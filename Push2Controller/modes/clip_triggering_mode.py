@@ -110,7 +110,6 @@ class ClipTriggeringMode(definitions.ShepherdControllerMode):
 
                     # Draw clip notes
                     if clip_length > 0.0:
-                        display_w = push2_python.constants.DISPLAY_LINE_PIXELS
                         draw_clip(ctx, clip, frame=(1.0/8 * track_num, 0.0, 1.0/8, 0.87), event_color=track_color + '_darker1', highlight_color=definitions.WHITE)
 
     def activate(self):
@@ -246,27 +245,12 @@ class ClipTriggeringMode(definitions.ShepherdControllerMode):
 
                     elif self.app.is_button_being_pressed(self.quantize_button):
                         if not clip.is_empty():
-                            current_quantization_step = clip.current_quantization_step
-                            if (current_quantization_step == 0.0):
-                                next_quantization_step = 4.0/16.0
-                            elif (current_quantization_step == 4.0/16.0):
-                                next_quantization_step = 4.0/8.0
-                            elif (current_quantization_step == 4.0/8.0):
-                                next_quantization_step = 4.0/4.0
-                            elif (current_quantization_step == 4.0/4.0):
-                                next_quantization_step = 0.0
-                            else:
-                                next_quantization_step = 0.0
+                            next_quantization_step = \
+                                definitions.NEXT_QUANTIZATION_STEP.get(clip.current_quantization_step, 0.0)
                             clip.quantize(next_quantization_step)
-                            quantization_step_labels = {
-                                0.25: '16th note',
-                                0.5: '8th note',
-                                1.0: '4th note',
-                                0.0: 'no quantization'
-                            }
                             self.app.add_display_notification("Quantized clip to {0}: {1}-{2}".format(
-                                quantization_step_labels.get(next_quantization_step,
-                                                             next_quantization_step), track_num + 1, clip_num + 1))
+                                definitions.QUANTIZATION_STEP_LABELS.get(next_quantization_step,
+                                                                         next_quantization_step), track_num + 1, clip_num + 1))
 
                     elif self.app.is_button_being_pressed(self.undo_button):
                         clip.undo()
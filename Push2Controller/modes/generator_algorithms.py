@@ -40,11 +40,13 @@ class RandomGeneratorAlgorithm(GeneratorAlogorithm):
         else:
             new_clip_length = random.randint(5, 13)
         random_sequence = []
-        for i in range(0, abs(self.parameters['density']['value'] + random.randint(-2, 2))):
-            timestamp = (new_clip_length - 0.5) * random.random()
-            duration = random.random() * 1.5 + 0.01
+        rand = random.random
+        randint = random.randint
+        for i in range(0, abs(self.parameters['density']['value'] + randint(-2, 2))):
+            timestamp = (new_clip_length - 0.5) * rand()
+            duration = rand() * 1.5 + 0.01
             random_sequence.append(
-                {'type': 1, 'midiNote': random.randint(64, 85), 'midiVelocity': 1.0, 'timestamp': timestamp,
+                {'type': 1, 'midiNote': randint(64, 85), 'midiVelocity': 1.0, 'timestamp': timestamp,
                  'duration': duration}
             )
         return random_sequence, new_clip_length
@@ -66,11 +68,14 @@ class RandomGeneratorAlgorithmPlus(GeneratorAlogorithm):
         else:
             new_clip_length = random.randint(5, 13)
         random_sequence = []
-        for i in range(0, abs(self.parameters['density']['value'] + random.randint(-2, 2))):
-            timestamp = (new_clip_length - 0.5) * random.random()
-            duration = max(0.1, random.random() * self.parameters['max_duration']['value'])
+        rand = random.random
+        randint = random.randint
+        max_duration = self.parameters['max_duration']['value']
+        for i in range(0, abs(self.parameters['density']['value'] + randint(-2, 2))):
+            timestamp = (new_clip_length - 0.5) * rand()
+            duration = max(0.1, rand() * max_duration)
             random_sequence.append(
-                {'type': 1, 'midiNote': random.randint(64, 85), 'midiVelocity': 1.0, 'timestamp': timestamp,
+                {'type': 1, 'midiNote': randint(64, 85), 'midiVelocity': 1.0, 'timestamp': timestamp,
                  'duration': duration}
             )
         return random_sequence, new_clip_length
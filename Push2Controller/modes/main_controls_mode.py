@@ -32,15 +32,18 @@ class MainControlsMode(definitions.ShepherdControllerMode):
     def activate(self):
         self.update_buttons()
 
+    recording_status_chars = frozenset('rwW')  # recording, cued to record, cued to stop recording
+
     def get_transport_buttons_state(self):
         is_playing = self.session.playing
         is_recording = False
         for track in self.session.tracks:
             for clip in track.clips:
-                clip_state = clip.get_status()
-                if 'r' in clip_state or 'w' in clip_state or 'W' in clip_state:
+                if not self.recording_status_chars.isdisjoint(clip.get_status()):
                     is_recording = True
                     break
+            if is_recording:
+                break
         metronome_on = self.session.metronome_on
         return is_playing, is_recording, metronome_on
 
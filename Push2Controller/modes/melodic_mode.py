@@ -8,7 +8,9 @@ class MelodicMode(definitions.ShepherdControllerMode):
 
     xor_group = 'pads'
 
-    notes_being_played = []
+    notes_being_played = None  # set to a list in initialize, bounded by max_notes_being_played
+    max_notes_being_played = 128
+    pad_color_matrix_scratch = None  # set to a reusable 8x8 matrix in initialize
     root_midi_note = 0  # default redefined in initialize
     scale_pattern = [True, False, True, False, True, True, False, True, False, True, False, True]
     fixed_velocity_mode = False
@@ -59,12 +61,17 @@ class MelodicMode(definitions.ShepherdControllerMode):
             self.lumi_midi_out.send(msg)
 
     def send_all_note_offs_to_lumi(self):
+        if self.lumi_midi_out is None:
+            return
+        send = self.lumi_midi_out.send
         for i in range(0, 128):
-            msg = mido.Message('note_off', note=i)
-            if self.lumi_midi_out is not None:
-                self.lumi_midi_out.send(msg)
+            send(mido.Message('note_off', note=i))
 
     def initialize(self, settings=None):
+        self.notes_being_played = []
+        # Scratch 8x8 matrix reused (filled in place) on every update_pads call so refreshing pad
+        # colors while notes are played does not allocate 9 new lists per refresh
+        self.pad_color_matrix_scratch = [[None] * 8 for _ in range(8)]
         if settings is not None:
             self.use_poly_at = settings.get('use_poly_at', True)
             self.set_root_midi_note(settings.get('root_midi_note', 64))
@@ -124,11 +131,21 @@ class MelodicMode(definitions.ShepherdControllerMode):
         pow_curve = [pow(e, 3*self.poly_at_curve_bending/100) for e in [i/self.poly_at_max_range for i in range(0, self.poly_at_max_range)]]
         return [int(127 * pow_curve[i]) if i < self.poly_at_max_range else 127 for i in range(0, 128)]
 
+    # NOTE: notes_being_played is mutated from the MIDI callback threads while update_pads and
+    # is_midi_note_being_played iterate it from the app loop thread, so it is only ever rebound to a
+    # freshly built list (never mutated in place): readers keep iterating whatever snapshot they grabbed
+
     def add_note_being_played(self, midi_note, source):
-        self.notes_being_played.append({'note': midi_note, 'source': source})
+        notes = self.notes_being_played + [{'note': midi_note, 'source': source}]
+        if len(notes) > self.max_notes_being_played:
+            # Bound the list so a missed note off can't grow it forever, dropping the oldest (most
+            # likely stale) entries
+            notes = notes[-self.max_notes_being_played:]
+        self.notes_being_played = notes
 
     def remove_note_being_played(self, midi_note, source):
-        self.notes_being_played = [note for note in self.notes_being_played if note['note'] != midi_note or note['source'] != source]
+        self.notes_being_played = [note for note in self.notes_being_played
+                                   if note['note'] != midi_note or note['source'] != source]
 
     def remove_all_notes_being_played(self):
         self.notes_being_played = []
@@ -164,10 +181,9 @@ class MelodicMode(definitions.ShepherdControllerMode):
         self.update_pads_backend_mapping()
 
     def update_pads_backend_mapping(self):
-        mapping = [-1 for i in range(0, 128)]
+        mapping = list(definitions.EMPTY_MIDI_MAPPING)
         for i in range(0, 8):
             for j in range(0, 8):
-                self.pad_ij_to_midi_note((7 - i, j))
                 mapping[36 + i * 8 + j] = self.pad_ij_to_midi_note((7 - i, j))
         device = self.state.get_input_hardware_device_by_name("PushSimulator" if self.app.using_push_simulator else "Push")
         if device is not None:
@@ -176,7 +192,7 @@ class MelodicMode(definitions.ShepherdControllerMode):
     def clear_pads_backend_mapping(self):
         device = self.state.get_input_hardware_device_by_name("PushSimulator" if self.app.using_push_simulator else "Push")
         if device is not None:
-            device.set_notes_mapping([-1 for i in range(0, 128)])
+            device.set_notes_mapping(definitions.EMPTY_MIDI_MAPPING)
 
     def activate(self):
 
@@ -239,9 +255,12 @@ class MelodicMode(definitions.ShepherdControllerMode):
         self.update_accent_button()
 
     def update_pads(self):
-        color_matrix = []
+        # Collect the currently played note numbers once so the check below is a set lookup per pad
+        # instead of a scan of notes_being_played for each of the 64 pads
+        notes_being_played_set = {note['note'] for note in self.notes_being_played}
+        color_matrix = self.pad_color_matrix_scratch
         for i in range(0, 8):
-            row_colors = []
+            row_colors = color_matrix[i]
             for j in range(0, 8):
                 corresponding_midi_note = self.pad_ij_to_midi_note([i, j])
                 cell_color = definitions.WHITE
@@ -252,11 +271,10 @@ class MelodicMode(definitions.ShepherdControllerMode):
                         cell_color = self.app.track_selection_mode.get_current_track_color()
                     except AttributeError:
                         cell_color = definitions.YELLOW
-                if self.is_midi_note_being_played(corresponding_midi_note):
+                if corresponding_midi_note in notes_being_played_set:
                     cell_color = definitions.NOTE_ON_COLOR
 
-                row_colors.append(cell_color)
-            color_matrix.append(row_colors)
+                row_colors[j] = cell_color
 
         self.push.pads.set_pads_color(color_matrix)
 
@@ -2,27 +2,31 @@ import definitions
 import push2_python
 import math
 
+from collections import namedtuple
+
 from definitions import ShepherdControllerMode
 from utils import show_text, draw_knob
 
+# Lightweight record for the (section, page) pairs tracked per device. A namedtuple keeps the tuple
+# memory/access profile while allowing readable field access
+SectionPage = namedtuple('SectionPage', ['section', 'page'])
+
 
 class MIDICCControl(object):
 
-    color = definitions.GRAY_LIGHT
-    color_rgb = None
-    name = 'Unknown'
-    section = 'unknown'
-    cc_number = 10  # 0-127
+    # Instances are created in bulk (up to 128 per device), so use __slots__ to avoid carrying a
+    # per-instance __dict__ for each of them
+    __slots__ = ('cc_number', 'name', 'section', 'get_color_func', 'value_labels_map')
+
     vmin = 0
     vmax = 127
-    get_color_func = None
-    value_labels_map = {}
 
     def __init__(self, cc_number, name, section_name, get_color_func):
-        self.cc_number = cc_number
+        self.cc_number = cc_number  # 0-127
         self.name = name
         self.section = section_name
         self.get_color_func = get_color_func
+        self.value_labels_map = {}
 
     def draw(self, ctx, x_part, value):
         draw_knob(ctx,
@@ -54,6 +58,7 @@ class MIDICCMode(ShepherdControllerMode):
     buttons_used = midi_cc_button_names + [page_left_button, page_right_button]
 
     device_midi_control_ccs = {}
+    sections_per_device = {}
     active_midi_control_ccs = []
     current_selected_section_and_page = {}
 
@@ -86,9 +91,18 @@ class MIDICCMode(ShepherdControllerMode):
                     self.device_midi_control_ccs[device_short_name].append(control)
                 print('- Loaded default MIDI cc mappings for {0}'.format(device_short_name))
       
+        # Precompute section name lists per device. The control mappings are static once loaded, so this
+        # avoids re-scanning every control on each update_display/update_buttons call
+        for device_short_name, controls in self.device_midi_control_ccs.items():
+            section_names = []
+            for control in controls:
+                if control.section not in section_names:
+                    section_names.append(control.section)
+            self.sections_per_device[device_short_name] = section_names
+
         # Fill in current page and section variables
         for device_short_name in self.device_midi_control_ccs:
-            self.current_selected_section_and_page[device_short_name] = (self.device_midi_control_ccs[device_short_name][0].section, 0)
+            self.current_selected_section_and_page[device_short_name] = SectionPage(self.device_midi_control_ccs[device_short_name][0].section, 0)
 
     def get_all_distinct_device_short_names_helper(self):
         return self.app.track_selection_mode.get_all_distinct_device_short_names()
@@ -100,15 +114,12 @@ class MIDICCMode(ShepherdControllerMode):
         return self.app.track_selection_mode.get_current_track_device_short_name()
 
     def get_current_track_midi_cc_sections(self):
-        section_names = []
-        for control in self.device_midi_control_ccs.get(self.get_current_track_device_short_name_helper(), []):
-            section_name = control.section
-            if section_name not in section_names:
-                section_names.append(section_name)
-        return section_names
+        return self.sections_per_device.get(self.get_current_track_device_short_name_helper(), [])
+
+    no_section_and_page = SectionPage([], 0)
 
     def get_currently_selected_midi_cc_section_and_page(self):
-        return self.current_selected_section_and_page.get(self.get_current_track_device_short_name_helper(), [[], 0])
+        return self.current_selected_section_and_page.get(self.get_current_track_device_short_name_helper(), self.no_section_and_page)
 
     def get_midi_cc_controls_for_current_track_and_section(self):
         section, _ = self.get_currently_selected_midi_cc_section_and_page()
@@ -124,12 +135,9 @@ class MIDICCMode(ShepherdControllerMode):
 
     def update_current_section_page(self, new_section=None, new_page=None):
         current_section, current_page = self.get_currently_selected_midi_cc_section_and_page()
-        result = [current_section, current_page]
-        if new_section is not None:
-            result[0] = new_section
-        if new_page is not None:
-            result[1] = new_page
-        self.current_selected_section_and_page[self.get_current_track_device_short_name_helper()] = result
+        self.current_selected_section_and_page[self.get_current_track_device_short_name_helper()] = SectionPage(
+            new_section if new_section is not None else current_section,
+            new_page if new_page is not None else current_page)
         self.active_midi_control_ccs = self.get_midi_cc_controls_for_current_track_section_and_page()
         self.app.buttons_need_update = True
         self.update_encoders_backend_mapping()
@@ -158,7 +166,7 @@ class MIDICCMode(ShepherdControllerMode):
             except IndexError:
                 topPushEncoders.append(-1)
 
-        mapping = [-1 for i in range(0, 128)]
+        mapping = list(definitions.EMPTY_MIDI_MAPPING)
         mapping[1] = 1  # Always allow modulation wheel
         mapping[64] = 64  # Always allow sustain pedal
         mapping[71:71+8] = topPushEncoders
@@ -169,7 +177,7 @@ class MIDICCMode(ShepherdControllerMode):
     def clear_encoders_backend_mapping(self):
         device = self.state.get_input_hardware_device_by_name("PushSimulator" if self.app.using_push_simulator else "Push")
         if device is not None:
-            device.set_control_change_mapping([-1 for i in range(0, 128)])
+            device.set_control_change_mapping(definitions.EMPTY_MIDI_MAPPING)
 
     def activate(self):
         self.update_buttons()
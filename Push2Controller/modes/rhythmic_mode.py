@@ -28,9 +28,9 @@ class RhythmicMode(MelodicMode):
         pass
 
     def update_pads(self):
-        color_matrix = []
+        color_matrix = self.pad_color_matrix_scratch
         for i in range(0, 8):
-            row_colors = []
+            row_colors = color_matrix[i]
             for j in range(0, 8):
                 corresponding_midi_note = self.pad_ij_to_midi_note([i, j])
                 cell_color = definitions.BLACK
@@ -46,8 +46,7 @@ class RhythmicMode(MelodicMode):
                 if self.is_midi_note_being_played(corresponding_midi_note):
                     cell_color = definitions.NOTE_ON_COLOR
 
-                row_colors.append(cell_color)
-            color_matrix.append(row_colors)
+                row_colors[j] = cell_color
 
         self.push.pads.set_pads_color(color_matrix)
 
@@ -25,9 +25,9 @@ class SliceNotesMode(MelodicMode):
         return self.start_note + 8 * (7 - pad_ij[0]) + pad_ij[1]
 
     def update_pads(self):
-        color_matrix = []
+        color_matrix = self.pad_color_matrix_scratch
         for i in range(0, 8):
-            row_colors = []
+            row_colors = color_matrix[i]
             for j in range(0, 8):
                 corresponding_midi_note = self.pad_ij_to_midi_note([i, j])
                 midi_16_note_groups_idx = corresponding_midi_note // 16
@@ -37,8 +37,7 @@ class SliceNotesMode(MelodicMode):
                     cell_color = definitions.WHITE
                 if self.is_midi_note_being_played(corresponding_midi_note):
                     cell_color = definitions.NOTE_ON_COLOR
-                row_colors.append(cell_color)
-            color_matrix.append(row_colors)
+                row_colors[j] = cell_color
 
         self.push.pads.set_pads_color(color_matrix)
 
@@ -11,6 +11,7 @@ import pyshepherd.pyshepherd
 class TrackSelectionMode(definitions.ShepherdControllerMode):
 
     devices_info = {}
+    track_colors_cache = {}  # track uuid -> color name
 
     track_button_names = [
         push2_python.constants.BUTTON_LOWER_ROW_1,
@@ -63,11 +64,17 @@ class TrackSelectionMode(definitions.ShepherdControllerMode):
         return self.get_selected_track().output_hardware_device_name
     
     def get_track_color(self, track: pyshepherd.pyshepherd.Track):
-        try:
-            track_idx = [idx for idx, t in enumerate(self.session.tracks) if track.uuid == t.uuid][0]
-        except IndexError:
-            track_idx = 0
-        return definitions.COLORS_NAMES[track_idx % 8]
+        # Track colors are derived from the track's position in the session, which is fixed for the
+        # lifetime of a track. Cache them per uuid so per-frame callers don't re-scan the track list
+        color = self.track_colors_cache.get(track.uuid, None)
+        if color is None:
+            try:
+                track_idx = [idx for idx, t in enumerate(self.session.tracks) if track.uuid == t.uuid][0]
+            except IndexError:
+                track_idx = 0
+            color = definitions.COLORS_NAMES[track_idx % 8]
+            self.track_colors_cache[track.uuid] = color
+        return color
     
     def get_current_track_color(self):
         return self.get_track_color(self.get_selected_track())
@@ -91,9 +98,13 @@ class TrackSelectionMode(definitions.ShepherdControllerMode):
 
     def send_select_track(self, track_idx):
         # Enabled input monitoring for the selected track only
+        # Only send messages for tracks whose monitoring state actually changes so a track selection
+        # does not flood the backend connection with redundant messages
         tracks = self.session.tracks
         for i in range(0, len(tracks)):
-            tracks[i].set_input_monitoring(i == track_idx)
+            should_monitor = i == track_idx
+            if tracks[i].input_monitoring != should_monitor:
+                tracks[i].set_input_monitoring(should_monitor)
 
     def select_track(self, track_idx):
         # Selects a track
@@ -1,11 +1,26 @@
 import pytest
 import sys
 import os
+from types import MappingProxyType
 from unittest.mock import Mock, patch
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Canonical fixture defaults, built once and shared read-only across all tests (the mapping proxy and
+# tuple make accidental mutation of the shared data fail loudly). Fixtures spread these into fresh
+# Mocks so per-test mutation stays isolated
+ENCODER_NAMES = ('encoder_1', 'encoder_2', 'encoder_3', 'encoder_4',
+                 'encoder_5', 'encoder_6', 'encoder_7', 'encoder_8')
+SESSION_DEFAULTS = MappingProxyType({
+    'is_playing': False,
+    'is_recording': False,
+    'metronome_on': False,
+    'fixed_length_recording_bars': 0,
+    'record_automation_enabled': False,
+    'meter': 4,
+})
+
 
 @pytest.fixture
 def mock_push2():
@@ -15,21 +30,14 @@ def mock_push2():
     mock.pads = Mock()
     mock.encoders = Mock()
     mock.display = Mock()
-    mock.encoders.available_names = ['encoder_1', 'encoder_2', 'encoder_3', 'encoder_4', 
-                                     'encoder_5', 'encoder_6', 'encoder_7', 'encoder_8']
+    mock.encoders.available_names = ENCODER_NAMES
     return mock
 
 
 @pytest.fixture
 def mock_session():
     """Mock Shepherd session"""
-    mock = Mock()
-    mock.is_playing = False
-    mock.is_recording = False
-    mock.metronome_on = False
-    mock.fixed_length_recording_bars = 0
-    mock.record_automation_enabled = False
-    mock.meter = 4
+    mock = Mock(**SESSION_DEFAULTS)
     mock.tracks = [Mock() for _ in range(8)]
     return mock
 
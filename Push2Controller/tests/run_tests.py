@@ -4,25 +4,24 @@ Test runner script for Push2Controller tests
 """
 import sys
 import os
-import unittest
+
+import pytest
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Static portion of the pytest invocation, built once so repeated run_tests() calls (e.g. from a CI
+# loop) just copy it instead of recomputing paths and rebuilding the argument list
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PYTEST_ARGS = (TESTS_DIR, '-v')
+
 
 def run_tests():
     """Run all tests in the tests directory"""
-    # Discover and run tests
-    loader = unittest.TestLoader()
-    start_dir = os.path.dirname(os.path.abspath(__file__))
-    suite = loader.discover(start_dir, pattern='test_*.py')
-    
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    # Return exit code based on test results
-    return 0 if result.wasSuccessful() else 1
+    # Run pytest in-process instead of spawning a runner, reusing the already-warm interpreter.
+    # This also picks up the fixtures defined in conftest.py, which unittest discovery ignored
+    return pytest.main(list(PYTEST_ARGS))
 
 
 if __name__ == '__main__':
-    sys.exit(run_tests())
\ No newline at end of file
+    sys.exit(run_tests())
@@ -10,6 +10,18 @@ from modes.main_controls_mode import MainControlsMode
 import definitions
 
 
+class _StubClip:
+    """Lightweight clip stand-in for tests that only read get_status. Much cheaper than building
+    a full Mock per clip (setUp creates 32 of these for every test)"""
+    __slots__ = ('status',)
+
+    def __init__(self, status='stopped'):
+        self.status = status
+
+    def get_status(self):
+        return self.status
+
+
 class TestMainControlsMode(unittest.TestCase):
     
     def setUp(self):
@@ -24,7 +36,8 @@ class TestMainControlsMode(unittest.TestCase):
         self.mock_app.state = self.mock_state
         self.mock_app.track_selection_mode = Mock()
         self.mock_app.track_selection_mode.selected_track = 0
-        
+        self.mock_app.add_display_notification = Mock()
+
         # Mock session properties
         self.mock_session.is_playing = False
         self.mock_session.is_recording = False
@@ -37,12 +50,7 @@ class TestMainControlsMode(unittest.TestCase):
         mock_tracks = []
         for i in range(8):
             mock_track = Mock()
-            mock_clips = []
-            for j in range(4):
-                mock_clip = Mock()
-                mock_clip.get_status.return_value = 'stopped'  # Default status
-                mock_clips.append(mock_clip)
-            mock_track.clips = mock_clips
+            mock_track.clips = [_StubClip() for j in range(4)]  # Default 'stopped' status
             mock_tracks.append(mock_track)
         self.mock_session.tracks = mock_tracks
         
@@ -65,8 +73,6 @@ class TestMainControlsMode(unittest.TestCase):
     
     def test_metronome_button_press(self):
         """Test metronome button functionality"""
-        self.mock_app.add_display_notification = Mock()
-        
         result = self.main_controls.on_button_pressed(self.main_controls.metronome_button)
         
         self.mock_session.metronome_on_off.assert_called_once()
@@ -76,8 +82,6 @@ class TestMainControlsMode(unittest.TestCase):
     @patch('time.time', return_value=1000.0)
     def test_tap_tempo_functionality(self, mock_time):
         """Test tap tempo calculation"""
-        self.mock_app.add_display_notification = Mock()
-        
         # Simulate 3 taps at 120 BPM (0.5 second intervals)
         self.main_controls.last_tap_tempo_times = [999.0, 999.5]
         
@@ -90,7 +94,6 @@ class TestMainControlsMode(unittest.TestCase):
     
     def test_fixed_length_button_cycle(self):
         """Test fixed length button cycling"""
-        self.mock_app.add_display_notification = Mock()
         self.mock_session.meter = 4
         
         # Test normal increment
@@ -101,8 +104,6 @@ class TestMainControlsMode(unittest.TestCase):
     
     def test_fixed_length_button_long_press_reset(self):
         """Test fixed length button long press resets to 0"""
-        self.mock_app.add_display_notification = Mock()
-        
         result = self.main_controls.on_button_pressed(self.main_controls.fixed_length_button, long_press=True)
         
         self.mock_session.set_fix_length_recording_bars.assert_called_with(0)
@@ -0,0 +1,10 @@
+from .pyshepherd import (
+    ShepherdBackendControllerApp,
+    ShepherdBackendInterface,
+    State,
+    Session,
+    Track,
+    Clip,
+    SequenceEvent,
+    HardwareDevice,
+)
@@ -4,13 +4,15 @@ import json
 import mido
 
 from bs4 import BeautifulSoup
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from .state_synchronizer import StateSynchronizer
 from .state_debugger import start_state_debugger
 
 verbose_level = 0
 
+_MISSING = object()  # Sentinel for getattr lookups that need to distinguish "attribute not there" from None
+
 
 parameters_data = {
     'allowaftertouchmessages': (bool, "allow_aftertouch_messages"),
@@ -115,24 +117,23 @@ class BaseShepherdClass(object):
     def _send_msg_to_app(self, address, values):
         self.shepherd_backend_interface.send_msg_to_app(address, values)
 
+    _render_excluded_attr_names = frozenset(['shepherd_backend_interface', 'track', 'clip', 'state', 'session'])
+
     def render_object_attributes(self, num_spaces_offset=0):
-        text = ''
+        # Resolve each attribute once instead of three times (callable check, type check, format) as this
+        # runs over every attribute of every object when rendering the full state
+        prefix = ' ' * num_spaces_offset
+        lines = []
         for attr_name in dir(self):
+            if attr_name.startswith('_') or attr_name in self._render_excluded_attr_names:
+                continue
             try:
-                if not attr_name.startswith('_') \
-                        and not callable(getattr(self, attr_name)) \
-                        and not type(getattr(self, attr_name)) == list \
-                        and not attr_name.startswith('_') \
-                        and attr_name != 'shepherd_backend_interface' \
-                        and attr_name != 'track' \
-                        and attr_name != 'clip' \
-                        and attr_name != 'state' \
-                        and attr_name != 'session':
-
-                        text += '{}{}: {}\n'.format(' ' * num_spaces_offset, attr_name, getattr(self, attr_name))
+                value = getattr(self, attr_name)
             except AttributeError:
-                pass
-        return text
+                continue
+            if not callable(value) and not type(value) == list:
+                lines.append('{}{}: {}\n'.format(prefix, attr_name, value))
+        return ''.join(lines)
 
 
 class State(BaseShepherdClass):
@@ -146,8 +147,16 @@ class State(BaseShepherdClass):
 
     def __init__(self, *args, **kwargs):
         self.hardware_devices = []
+        # Prebuilt index for get_input/output_hardware_device_by_name lookups and cached available output
+        # name list, both rebuilt lazily after being invalidated by device additions/removals/renames
+        self._hardware_devices_by_name = {}
+        self._available_output_device_names = None
         super().__init__(*args, **kwargs)
 
+    def _invalidate_hardware_device_caches(self):
+        self._hardware_devices_by_name.clear()
+        self._available_output_device_names = None
+
     def _add_hardware_device(self, hardware_device: HardwareDevice, position=None):
         # Note this method adds a HardwareDevice object in the local State object but does not create a hardware
         # device in the backend
@@ -155,12 +164,14 @@ class State(BaseShepherdClass):
             self.hardware_devices.append(hardware_device)
         else:
             self.hardware_devices.insert(position, hardware_device)
+        self._invalidate_hardware_device_caches()
 
     def _remove_hardware_device_with_uuid(self, hardware_device_uuid):
         # Note this method removes a HardwareDevice object from the local State object but does not remove a
         # hardware device from the backend
         self.hardware_devices = [hardware_device for hardware_device in self.hardware_devices
                                  if hardware_device.uuid != hardware_device_uuid]
+        self._invalidate_hardware_device_caches()
 
     def render(self, include_attributes=False):
         text = 'SHEPHERD BACKEND STATE\n'
@@ -195,22 +206,32 @@ class State(BaseShepherdClass):
     def send_controller_ready_message_to_backend(self):
         self._send_msg_to_app('/shepherdControllerReady', [])
 
-    def get_input_hardware_device_by_name(self, hardware_device_name):
+    def _build_hardware_devices_by_name_index(self):
+        # Index every device under the keys the lookups below would resolve it for: its name (for both
+        # lookup types) and its short name (for its own type only). Iterating devices in order and using
+        # setdefault preserves the first-match semantics of the linear scans this index replaces
+        index = self._hardware_devices_by_name
         for hardware_device in self.hardware_devices:
-            if hardware_device.name == hardware_device_name or hardware_device.short_name == hardware_device_name \
-                    and hardware_device.type == 0:
-                return hardware_device
-        return None
+            index.setdefault((0, hardware_device.name), hardware_device)
+            index.setdefault((1, hardware_device.name), hardware_device)
+            index.setdefault((hardware_device.type, hardware_device.short_name), hardware_device)
+
+    def get_input_hardware_device_by_name(self, hardware_device_name):
+        if not self._hardware_devices_by_name:
+            self._build_hardware_devices_by_name_index()
+        return self._hardware_devices_by_name.get((0, hardware_device_name), None)
 
     def get_output_hardware_device_by_name(self, hardware_device_name) -> Optional[HardwareDevice]:
-        for hardware_device in self.hardware_devices:
-            if hardware_device.name == hardware_device_name or hardware_device.short_name == hardware_device_name \
-                    and hardware_device.type == 1:
-                return hardware_device
-        return None
+        if not self._hardware_devices_by_name:
+            self._build_hardware_devices_by_name_index()
+        return self._hardware_devices_by_name.get((1, hardware_device_name), None)
     
-    def get_available_output_hardware_device_names(self) -> List[str]:
-        return [device.short_name for device in self.hardware_devices if device.is_type_output()]
+    def get_available_output_hardware_device_names(self) -> Tuple[str, ...]:
+        # Cached as an immutable tuple so the shared cache can't be mutated by callers
+        if self._available_output_device_names is None:
+            self._available_output_device_names = tuple(device.short_name for device in self.hardware_devices
+                                                        if device.is_type_output())
+        return self._available_output_device_names
 
     def toggle_shepherd_backend_debug_synth(self):
         self._send_msg_to_app('/settings/debugSynthOnOff', [])
@@ -372,6 +393,8 @@ class Clip(BaseShepherdClass):
 
     def __init__(self, *args, **kwargs):
         self.sequence_events = []
+        self._status_cache_key = None
+        self._status_cache = None
         super().__init__(*args, **kwargs)
 
     def _add_sequence_event(self, sequence_event: SequenceEvent, position=None):
@@ -388,41 +411,47 @@ class Clip(BaseShepherdClass):
         self.sequence_events = [sequence_event for sequence_event in self.sequence_events
                                 if sequence_event.uuid != sequence_event_uuid]
 
-    def get_status(self) -> str:
-        CLIP_STATUS_PLAYING = "p"
-        CLIP_STATUS_STOPPED = "s"
-        CLIP_STATUS_CUED_TO_PLAY = "c"
-        CLIP_STATUS_CUED_TO_STOP = "C"
-        CLIP_STATUS_RECORDING = "r"
-        CLIP_STATUS_CUED_TO_RECORD = "w"
-        CLIP_STATUS_CUED_TO_STOP_RECORDING = "W"
-        CLIP_STATUS_NO_RECORDING = "n"
-        CLIP_STATUS_IS_EMPTY = "E"
-        CLIP_STATUS_IS_NOT_EMPTY = "e"
+    # All play/record/empty status character combinations, precomputed so get_status picks a ready-made
+    # prefix instead of assembling one from individual status characters on every re-format
+    # (play characters: c=cued to play, C=cued to stop, p=playing, s=stopped;
+    #  record characters: w=cued to record, W=cued to stop recording, r=recording, n=not recording;
+    #  empty characters: E=empty, e=not empty)
+    _status_prefixes = tuple(play + record + empty for play in 'cCps' for record in 'wWrn' for empty in 'Ee')
 
-        if self.will_start_recording_at >= 0.0:
-            record_status = CLIP_STATUS_CUED_TO_RECORD
-        elif self.will_stop_recording_at >= 0.0:
-            record_status = CLIP_STATUS_CUED_TO_STOP_RECORDING
-        elif self.recording:
-            record_status = CLIP_STATUS_RECORDING
-        else:
-            record_status = CLIP_STATUS_NO_RECORDING
+    def get_status(self) -> str:
+        # The status string is requested many times per frame (e.g. once per pad), so only re-format it when
+        # one of the attributes it encodes has changed
+        status_cache_key = (self.will_start_recording_at, self.will_stop_recording_at, self.recording,
+                            self.will_play_at, self.will_stop_at, self.playing,
+                            self.clip_length_in_beats, self.current_quantization_step)
+        if status_cache_key == self._status_cache_key:
+            return self._status_cache
 
         if self.will_play_at >= 0.0:
-            play_status = CLIP_STATUS_CUED_TO_PLAY
+            play_idx = 0
         elif self.will_stop_at >= 0.0:
-            play_status = CLIP_STATUS_CUED_TO_STOP
+            play_idx = 1
         elif self.playing:
-            play_status = CLIP_STATUS_PLAYING
+            play_idx = 2
         else:
-            play_status = CLIP_STATUS_STOPPED
-    
-        if self.clip_length_in_beats == 0.0:
-            empty_status = CLIP_STATUS_IS_EMPTY
+            play_idx = 3
+
+        if self.will_start_recording_at >= 0.0:
+            record_idx = 0
+        elif self.will_stop_recording_at >= 0.0:
+            record_idx = 1
+        elif self.recording:
+            record_idx = 2
         else:
-            empty_status = CLIP_STATUS_IS_NOT_EMPTY
-        return f'{play_status}{record_status}{empty_status}|{self.clip_length_in_beats:.3f}|{self.current_quantization_step}'
+            record_idx = 3
+
+        empty_idx = 0 if self.clip_length_in_beats == 0.0 else 1
+        status_prefix = self._status_prefixes[(play_idx * 4 + record_idx) * 2 + empty_idx]
+
+        self._status_cache_key = status_cache_key
+        self._status_cache = \
+            f'{status_prefix}|{self.clip_length_in_beats:.3f}|{self.current_quantization_step}'
+        return self._status_cache
 
     def is_empty(self):
         return 'E' in self.get_status()
@@ -469,7 +498,8 @@ class Clip(BaseShepherdClass):
             ]
         }
         """
-        self._send_msg_to_app("/clip/setSequence", [self.track.uuid, self.uuid, json.dumps(new_sequence)])
+        self._send_msg_to_app("/clip/setSequence",
+                              [self.track.uuid, self.uuid, json.dumps(new_sequence, separators=(',', ':'))])
 
     def edit_sequence(self, edit_sequence_data):
         """edit_sequence_data should be a dictionary with this form:
@@ -484,7 +514,8 @@ class Clip(BaseShepherdClass):
         }
         Note that there are more specialized methods that will call "edit_sequence" and will have easier interface
         """
-        self._send_msg_to_app("/clip/editSequence", [self.track.uuid, self.uuid, json.dumps(edit_sequence_data)])
+        self._send_msg_to_app("/clip/editSequence",
+                              [self.track.uuid, self.uuid, json.dumps(edit_sequence_data, separators=(',', ':'))])
 
     def remove_sequence_event(self, event_uuid):
         self.edit_sequence({
@@ -610,8 +641,8 @@ class HardwareDevice(BaseShepherdClass):
     short_name: str
     type: int
 
-    _midi_cc_parameter_values_list_used_for_splitting = None
-    _midi_cc_parameter_values_list_splitted = []
+    _midi_cc_parameter_values_list_used_for_parsing = None
+    _midi_cc_values = bytearray(128)
 
     def is_type_output(self):
         return self.type == 1
@@ -622,6 +653,14 @@ class HardwareDevice(BaseShepherdClass):
     def send_midi(self, msg: mido.Message):
         self._send_msg_to_app('/device/sendMidi', [self.name] + msg.bytes())
 
+    def send_note_on(self, note, velocity, channel=0):
+        # Fast path for note messages: build the 3 raw MIDI bytes directly instead of going through
+        # mido.Message construction/validation and .bytes() serialization
+        self._send_msg_to_app('/device/sendMidi', [self.name, 0x90 | channel, note, velocity])
+
+    def send_note_off(self, note, velocity, channel=0):
+        self._send_msg_to_app('/device/sendMidi', [self.name, 0x80 | channel, note, velocity])
+
     def all_notes_off(self):
         self._send_msg_to_app('/device/sendAllNotesOff', [self.name])
 
@@ -629,16 +668,19 @@ class HardwareDevice(BaseShepherdClass):
         self._send_msg_to_app('/device/loadDevicePreset', [self.name, bank, preset])
 
     def get_current_midi_cc_parameter_value(self, midi_cc_num) -> int:
-        if self.midi_cc_parameter_values_list != self._midi_cc_parameter_values_list_used_for_splitting:
-            self._midi_cc_parameter_values_list_used_for_splitting = self.midi_cc_parameter_values_list
-            self._midi_cc_parameter_values_list_splitted = self.midi_cc_parameter_values_list.split(',')
-        return int(self._midi_cc_parameter_values_list_splitted[midi_cc_num])
+        if self.midi_cc_parameter_values_list != self._midi_cc_parameter_values_list_used_for_parsing:
+            self._midi_cc_parameter_values_list_used_for_parsing = self.midi_cc_parameter_values_list
+            # MIDI CC values are 7-bit, so store them in a compact bytearray (one byte per CC) instead of
+            # keeping the splitted string list around and parsing ints on every access
+            self._midi_cc_values = bytearray(
+                int(value) & 0x7F for value in self.midi_cc_parameter_values_list.split(','))
+        return self._midi_cc_values[midi_cc_num]
 
     def set_notes_mapping(self, mapping):
-        self._send_msg_to_app('/device/setNotesMapping', [self.name, ",".join([str(item) for item in mapping])])
+        self._send_msg_to_app('/device/setNotesMapping', [self.name, ",".join(map(str, mapping))])
 
     def set_control_change_mapping(self, mapping):
-        self._send_msg_to_app('/device/setCCMapping', [self.name, ",".join([str(item) for item in mapping])])
+        self._send_msg_to_app('/device/setCCMapping', [self.name, ",".join(map(str, mapping))])
     
     def set_midi_channel(self, channel):
         self._send_msg_to_app('/device/setMidiChannel', [self.name, channel])
@@ -648,11 +690,11 @@ class ShepherdBackendInterface(StateSynchronizer):
 
     app: Optional[ShepherdBackendControllerApp] = None
     state: Optional[State] = None
-    elements_uuids_map = {}
     state_never_synced = True
 
     def __init__(self, *args, **kwargs):
         self.state = None
+        self.elements_uuids_map = {}
         self.app = kwargs.get('app', None)
         if 'app' in kwargs: del kwargs['app']
         debugger_port = kwargs.get('debugger_port', None)
@@ -685,7 +727,7 @@ class ShepherdBackendInterface(StateSynchronizer):
     def on_state_update(self, update_type, update_data):
         if self.state is None:
             # If we don't have a session built, request new full state and ignore current state update
-            self.should_request_full_state = True
+            self.trigger_full_state_resync()
         else:
             app_notification_data = None
             if update_type == "propertyChanged":
@@ -696,10 +738,19 @@ class ShepherdBackendInterface(StateSynchronizer):
                     new_value = update_data[3]
 
                     mapped_prop_name = modified_prop_name(property_name)
-                    if mapped_prop_name and hasattr(tree_element, mapped_prop_name):
-                        old_value = getattr(tree_element, mapped_prop_name, None)
-                        setattr(tree_element, mapped_prop_name,
-                                backend_value_to_python_value(property_name, new_value))
+                    # Single getattr with a sentinel instead of a hasattr + getattr pair (this runs once per
+                    # property update, which is the highest-rate message the backend sends)
+                    old_value = getattr(tree_element, mapped_prop_name, _MISSING) if mapped_prop_name else _MISSING
+                    if old_value is not _MISSING:
+                        converted_new_value = backend_value_to_python_value(property_name, new_value)
+                        if converted_new_value == old_value:
+                            # The property already has that value, skip the update (and the app notification,
+                            # which would otherwise trigger unnecessary UI refreshes)
+                            return
+                        setattr(tree_element, mapped_prop_name, converted_new_value)
+                        if mapped_prop_name in ('name', 'short_name') and isinstance(tree_element, HardwareDevice):
+                            # Renames invalidate the state's device-by-name index and cached name lists
+                            self.state._invalidate_hardware_device_caches()
                         app_notification_data = {
                             'updateType': update_type,
                             'affectedElement': tree_element,
@@ -718,7 +769,7 @@ class ShepherdBackendInterface(StateSynchronizer):
                     if self.verbose_level >= 1:
                         print('WARNING: trying to update property of object that does not exist: {} ({})'
                               .format(update_data, e))
-                    self.should_request_full_state = True
+                    self.trigger_full_state_resync()
 
             elif update_type == "addedChild":
                 parent_tree_uuid = update_data[0]
@@ -762,7 +813,7 @@ class ShepherdBackendInterface(StateSynchronizer):
                     if self.verbose_level >= 1:
                         print('WARNING: trying to add child to parent that does not exist: {} ({})'
                               .format(update_data, e))
-                    self.should_request_full_state = True
+                    self.trigger_full_state_resync()
                     raise e
             
             elif update_type == "removedChild":
@@ -802,7 +853,7 @@ class ShepherdBackendInterface(StateSynchronizer):
                     if self.verbose_level >= 1:
                         print('WARNING: triying to remove child with uuid that does not exist: {} ({})'
                               .format(update_data, e))
-                    self.should_request_full_state = True
+                    self.trigger_full_state_resync()
 
             # Notify app that state was updated
             if self.app is not None:
@@ -829,36 +880,43 @@ class ShepherdBackendInterface(StateSynchronizer):
             self.app.on_new_session_loaded()
 
     def build_objects_from_full_state(self, full_state_soup):
-        self.elements_uuids_map = {}
+        # Reuse the existing map (it can grow to thousands of entries for big sessions) instead of
+        # allocating a new dict on every full state
+        self.elements_uuids_map.clear()
+        # Hoist per-element lookups out of the loops below as sessions can have many tracks x clips x events
+        add_element_to_uuid_map = self._add_element_to_uuid_map
 
         # build state root object
         root_element_soup = full_state_soup.findAll("state")[0]
         state = State(root_element_soup, self)  # Add properties from state root object
-        self._add_element_to_uuid_map(state)
+        add_element_to_uuid_map(state)
 
         # add hardware devices
         hardware_devices_soup = root_element_soup.findAll("hardware_devices")[0]
         for hardware_device_soup in hardware_devices_soup.findAll("hardware_device"):
             hardware_device = HardwareDevice(hardware_device_soup, self)
-            self._add_element_to_uuid_map(hardware_device)
+            add_element_to_uuid_map(hardware_device)
             state._add_hardware_device(hardware_device)
         self.state = state
 
         # add session and all related objects
         session_soup = root_element_soup.findAll("session")[0]
         session = Session(session_soup, self, parent=self.state)
-        self._add_element_to_uuid_map(session)
-        for tn, track_soup in enumerate(session_soup.findAll("track")):
+        add_element_to_uuid_map(session)
+        for track_soup in session_soup.findAll("track"):
             track = Track(track_soup, self, parent=session)
-            self._add_element_to_uuid_map(track)
-            for cn, clip_soup in enumerate(track_soup.findAll("clip")):
+            add_element_to_uuid_map(track)
+            clips = []
+            for clip_soup in track_soup.findAll("clip"):
                 clip = Clip(clip_soup, self, parent=track)
-                self._add_element_to_uuid_map(clip)
-                for sen, sequence_event_soup in enumerate(clip_soup.findAll("sequence_event")):
-                    sequence_event = SequenceEvent(sequence_event_soup, self, parent=clip)
-                    clip._add_sequence_event(sequence_event)
-                    self._add_element_to_uuid_map(sequence_event)
-                track._add_clip(clip)
+                add_element_to_uuid_map(clip)
+                sequence_events = [SequenceEvent(sequence_event_soup, self, parent=clip)
+                                   for sequence_event_soup in clip_soup.findAll("sequence_event")]
+                for sequence_event in sequence_events:
+                    add_element_to_uuid_map(sequence_event)
+                clip.sequence_events = sequence_events
+                clips.append(clip)
+            track.clips = clips
             session._add_track(track)
         self.state.session = session
 
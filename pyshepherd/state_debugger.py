@@ -8,14 +8,23 @@ state_debugger_port = 5100
 state_debugger_autoreload_ms = 1000
 state_debugger_server = Flask(__name__)
 ss_instance = None
+last_rendered_state = (None, None)  # (cache key the render corresponds to, rendered text)
 
 
 @state_debugger_server.route('/')
 def state_debugger():
+    global last_rendered_state
     if ss_instance is None or ss_instance.state is None:
         state = 'No state has been synced yet'
     else:
-        state = '{}'.format(ss_instance.state.render(include_attributes=True))
+        # Only re-render the state text if state updates have been applied since the last render, otherwise
+        # every autoreload poll would walk and format the full state tree again. The state object's identity
+        # is part of the key because a full state rebuild replaces the state wholesale without necessarily
+        # changing last_update_id
+        cache_key = (ss_instance.last_update_id, id(ss_instance.state))
+        if last_rendered_state[0] != cache_key or last_rendered_state[1] is None:
+            last_rendered_state = (cache_key, '{}'.format(ss_instance.state.render(include_attributes=True)))
+        state = last_rendered_state[1]
     return render_template('state_debugger.html',
                            state=state,
                            xml=False,
@@ -25,6 +34,8 @@ def state_debugger():
 class StateDebuggerServerThread(threading.Thread):
 
     def __init__(self, port, *args, **kwargs):
+        # Daemon thread so the debugger server does not keep the process alive on exit
+        kwargs.setdefault('daemon', True)
         super().__init__(*args, **kwargs)
         self.port = port
 
@@ -1,4 +1,6 @@
 import asyncio
+import queue
+import random
 import ssl
 import threading
 import time
@@ -17,7 +19,7 @@ def state_update_handler(*values):
     update_id = values[1]
     update_data = values[2:]
     if ss_instance is not None:
-        ss_instance.apply_update(update_id, update_type, update_data)
+        ss_instance.set_state_update(update_id, update_type, update_data)
     
 
 def full_state_handler(*values):
@@ -27,6 +29,49 @@ def full_state_handler(*values):
         ss_instance.set_full_state(update_id, new_state_raw)
 
 
+def app_started_message_handler(data):
+    ss_instance.app_has_started()
+
+
+def state_update_message_handler(data):
+    data_parts = data.split(';')
+    update_type = data_parts[0]
+    update_id = int(data_parts[1])
+    if update_type == "propertyChanged" or update_type == "removedChild":
+        # Can safely use the data parts after splitting by ; because we know no ; characters would be in the data
+        update_data = data_parts[2:]
+    elif update_type == "addedChild":
+        # Can't directly use split by ; because the XML state portion might contain ; characters inside, need to be careful
+        update_data = [data_parts[2], data_parts[3], data_parts[4], ';'.join(data_parts[5:])]
+    args = [update_type, update_id] + update_data
+    state_update_handler(*args)
+
+
+def full_state_message_handler(data):
+    # Split data at first ocurrence of ; instead of all ocurrences of ; as character ; might be in XML state portion
+    split_at = data.find(';')
+    data_parts = data[:split_at], data[split_at + 1:]
+    update_id = int(data_parts[0])
+    full_state_raw = data_parts[1]
+    args = [update_id, full_state_raw]
+    full_state_handler(*args)
+
+
+def alive_message_handler(data):
+    # When using WS communication we don't need the /alive message to know the connection is alive as WS manages that
+    pass
+
+
+# Address dispatch table built once at import time so ws_on_message does a single dict lookup per message
+# instead of comparing the address against every known one
+ws_message_handlers = {
+    '/app_started': app_started_message_handler,
+    '/state_update': state_update_message_handler,
+    '/full_state': full_state_message_handler,
+    '/alive': alive_message_handler,
+}
+
+
 def ws_on_message(ws, message):
     if ss_instance is not None:
         ss_instance.ws_connection_ok = True
@@ -35,37 +80,19 @@ def ws_on_message(ws, message):
     if isinstance(message, bytes):
         message = message.decode('utf-8')
 
-    address = message[:message.find(':')]
-    data = message[message.find(':') + 1:]
+    split_at = message.find(':')
+    if split_at == -1 or split_at > 64:
+        # Malformed message (no address separator, or an "address" far longer than any real one). Drop it
+        # here before slicing a potentially huge payload or hitting the handlers
+        if ss_instance is not None and ss_instance.verbose_level >= 1:
+            print('WARNING: Ignoring malformed WS message ({} bytes)'.format(len(message)))
+        return
+    address = message[:split_at]
+    data = message[split_at + 1:]
 
-    if address == '/app_started':
-        ss_instance.app_has_started()
-
-    elif address == '/state_update':
-        data_parts = data.split(';')
-        update_type = data_parts[0]
-        update_id = int(data_parts[1])
-        if update_type == "propertyChanged" or update_type == "removedChild":
-            # Can safely use the data parts after splitting by ; because we know no ; characters would be in the data
-            update_data = data_parts[2:]
-        elif update_type == "addedChild":
-            # Can't directly use split by ; because the XML state portion might contain ; characters inside, need to be careful
-            update_data = [data_parts[2], data_parts[3], data_parts[4], ';'.join(data_parts[5:])]
-        args = [update_type, update_id] + update_data
-        state_update_handler(*args)
-
-    elif address == '/full_state':
-        # Split data at first ocurrence of ; instead of all ocurrences of ; as character ; might be in XML state portion
-        split_at = data.find(';')
-        data_parts = data[:split_at], data[split_at + 1:]
-        update_id = int(data_parts[0])
-        full_state_raw = data_parts[1]
-        args = [update_id, full_state_raw]
-        full_state_handler(*args)
-
-    elif address == '/alive':
-        # When using WS communication we don't need the /alive message to know the connection is alive as WS manages that
-        pass
+    handler = ws_message_handlers.get(address, None)
+    if handler is not None:
+        handler(data)
 
 
 def ws_on_error(ws, error):
@@ -95,24 +122,30 @@ def ws_on_open(ws):
 
 class WSConnectionThread(threading.Thread):
 
-    reconnect_interval = 2
+    reconnect_interval = 2  # Base reconnect interval (seconds), grows exponentially on repeated failures
+    max_reconnect_interval = 30
     last_time_tried_wss = True  # Start trying ws connection (instead of wss)
 
-    def __init__(self, port, state_synchronizer, *args, **kwargs):
+    def __init__(self, port, state_synchronizer, *args, host='localhost', **kwargs):
+        # Daemon thread so a lingering (re)connection loop does not keep the process alive on exit
+        kwargs.setdefault('daemon', True)
         super().__init__(*args, **kwargs)
+        self.host = host
         self.port = port
         self.state_synchronizer = state_synchronizer
 
     def run(self):
         # Try to establish a connection with the websockets server
-        # If it can't be established, tries again every self.reconnect_interval seconds
+        # If it can't be established, tries again with exponential backoff (plus some random jitter so
+        # several controllers don't all retry in lockstep when the backend comes back up)
         # Because we don't know if the server will use wss or not, we alternatively try
         # one or the other
         asyncio.set_event_loop(asyncio.new_event_loop())
+        current_reconnect_interval = self.reconnect_interval
         while True:
             try_wss = False #not self.last_time_tried_wss  # Force use of WS
             self.last_time_tried_wss = not self.last_time_tried_wss
-            ws_endpoint = "ws{}://localhost:{}/shepherd_coms/".format('s' if try_wss else '', self.port)
+            ws_endpoint = "ws{}://{}:{}/shepherd_coms/".format('s' if try_wss else '', self.host, self.port)
             ws = websocket.WebSocketApp(ws_endpoint,
                                     on_open=ws_on_open,
                                     on_message=ws_on_message,
@@ -121,26 +154,79 @@ class WSConnectionThread(threading.Thread):
             self.state_synchronizer.ws_connection = ws
             if self.state_synchronizer.verbose_level >= 1:
                 print('* Connecting to WS server: {}'.format(ws_endpoint))
+            connection_start_time = time.monotonic()
+            # Note: permessage-deflate compression would help a lot here (full state XML is highly
+            # repetitive), but the websocket-client library does not implement RFC 7692 so it can't be
+            # negotiated from this side. Revisit if the backend's WS server and a client library that
+            # supports it become available
             ws.run_forever(sslopt={"cert_reqs": ssl.CERT_NONE}, skip_utf8_validation=True)
+            if time.monotonic() - connection_start_time > self.max_reconnect_interval:
+                # We held a connection for a while, so this is a fresh disconnect and not a failing retry
+                current_reconnect_interval = self.reconnect_interval
+            wait_time = current_reconnect_interval + random.uniform(0, current_reconnect_interval / 2)
             if self.state_synchronizer.verbose_level >= 1:
-                print('WS connection lost - will try connecting again in {} seconds'.format(self.reconnect_interval))
-            time.sleep(self.reconnect_interval)
+                print('WS connection lost - will try connecting again in {:.1f} seconds'.format(wait_time))
+            time.sleep(wait_time)
+            current_reconnect_interval = min(current_reconnect_interval * 2, self.max_reconnect_interval)
     
 
 class RequestStateThread(threading.Thread):
 
     def __init__(self, state_synchronizer, *args, **kwargs):
+        # Daemon thread so the request loop does not keep the process alive on exit
+        kwargs.setdefault('daemon', True)
         super().__init__(*args, **kwargs)
         self.state_synchronizer = state_synchronizer
 
     def run(self):
-        asyncio.set_event_loop(asyncio.new_event_loop())
         if self.state_synchronizer.verbose_level >= 1:
             print('* Starting loop to request state')
+        full_state_request_pending = self.state_synchronizer.full_state_request_pending
+        while True:
+            # Sleep until a full state request is actually pending instead of polling the flag continuously
+            full_state_request_pending.wait()
+            self.state_synchronizer.request_full_state()
+            time.sleep(1.0/state_request_hz)  # Throttle retries while the request remains pending
+
+
+class StateMessageWorkerThread(threading.Thread):
+
+    def __init__(self, state_synchronizer, *args, **kwargs):
+        # Daemon thread so pending state work does not keep the process alive on exit
+        kwargs.setdefault('daemon', True)
+        super().__init__(*args, **kwargs)
+        self.state_synchronizer = state_synchronizer
+
+    def run(self):
+        inbox = self.state_synchronizer.state_message_inbox
         while True:
-            time.sleep(1.0/state_request_hz)
-            if self.state_synchronizer.should_request_full_state:
-                self.state_synchronizer.request_full_state()
+            items = [inbox.get()]
+            # Drain whatever else already arrived. Items are always processed in arrival order;
+            # looking at the whole pending batch only serves the coalescing step below
+            try:
+                while True:
+                    items.append(inbox.get_nowait())
+            except queue.Empty:
+                pass
+            # A full state snapshot replaces the whole tree, so everything queued before the newest
+            # one in the batch is superseded by it and its application can be skipped
+            newest_full_state_idx = -1
+            for idx, item in enumerate(items):
+                if item[0] == 'full_state':
+                    newest_full_state_idx = idx
+            for idx, item in enumerate(items):
+                try:
+                    if item[0] == 'full_state':
+                        if idx == newest_full_state_idx:
+                            self.state_synchronizer.apply_full_state(item[1], item[2])
+                    elif idx > newest_full_state_idx:
+                        self.state_synchronizer.apply_update(item[1], item[2], item[3])
+                    else:
+                        # Superseded update: skip the work but keep the update id sequence continuous
+                        # so the gap detector in apply_update is not spuriously triggered afterwards
+                        self.state_synchronizer.last_update_id = item[1]
+                except Exception:
+                    print(traceback.format_exc())
 
 
 class StateSynchronizer(object):
@@ -149,7 +235,7 @@ class StateSynchronizer(object):
     ws_connection_ok = False
 
     last_update_id = -1
-    should_request_full_state = False
+    last_full_state_hash = None
     full_state_requested = False
     last_time_full_state_requested = 0
     full_state_request_timeout = 5  # Seconds
@@ -159,13 +245,30 @@ class StateSynchronizer(object):
 
     verbose_level = None
 
+    @property
+    def should_request_full_state(self):
+        return self.full_state_request_pending.is_set()
+
+    @should_request_full_state.setter
+    def should_request_full_state(self, value):
+        # Kept as a property so existing call sites can keep assigning a bool, but backed by an Event so the
+        # request state thread can block on it instead of polling
+        if value:
+            self.full_state_request_pending.set()
+        else:
+            self.full_state_request_pending.clear()
+
     def __init__(self,
                  ws_port=8126,
+                 ws_host='localhost',
                  verbose_level=1):
 
         global ss_instance
         ss_instance = self
         self.verbose_level = verbose_level
+        self.full_state_request_pending = threading.Event()
+        self.ws_send_lock = threading.Lock()
+        self.state_message_inbox = queue.Queue()
 
         if ws_port is None:
             raise Exception('Web sockets port not properly configured')
@@ -174,23 +277,45 @@ class StateSynchronizer(object):
             print('* Using WebSockets to communicate with app')
 
             # Start websockets client to handle communication with app
-        WSConnectionThread(ws_port, self).start()
+        WSConnectionThread(ws_port, self, host=ws_host).start()
 
         # Start Thread to request state to app
         # This thread will request the full state if self.should_request_full_state is set to True
         # (which by default is false)
         RequestStateThread(self).start()
+
+        # Start worker thread that applies state messages (full states and incremental updates) off
+        # the WS reader thread, preserving their arrival order
+        StateMessageWorkerThread(self).start()
+
         self.should_request_full_state = True
 
     def send_msg_to_app(self, address, values):
-        if self.ws_connection is not None and self.ws_connection_ok:
-            self.ws_connection.send(address + ':' + ';'.join([str(value) for value in values]))
+        # Capture the connection reference once so a reconnect swapping self.ws_connection between the check
+        # and the send cannot make us send through a half-initialized connection. The message is also built
+        # before taking the lock so it is only held for the actual socket write.
+        ws_connection = self.ws_connection
+        if ws_connection is not None and self.ws_connection_ok:
+            message = address + ':' + ';'.join(map(str, values))
+            # Messages are sent from several threads (UI loop, WS callbacks, request state thread...), and
+            # WebSocketApp.send is not thread safe, so serialize the actual socket writes
+            with self.ws_send_lock:
+                ws_connection.send(message)
 
     def app_has_started(self):
         self.last_update_id = -1
+        self.last_full_state_hash = None  # Force next full state to be applied even if identical to the last one
         self.full_state_requested = False
         self.should_request_full_state = True
 
+    def trigger_full_state_resync(self):
+        # Used when a desync is detected (update id gap, updates referencing unknown elements...). Unlike
+        # plain should_request_full_state = True, this also drops the duplicate-skip hash: the local mirror
+        # is suspected to have diverged, so the next full state must be applied even if the backend's
+        # payload is byte-identical to the last applied one (e.g. an idle/stopped session)
+        self.last_full_state_hash = None
+        self.should_request_full_state = True
+
     def app_connection_lost(self):
         # Maybe subclasses want to do something with that...
         pass
@@ -199,7 +324,9 @@ class StateSynchronizer(object):
         return not self.ws_connection_ok  # Consider app down if no active WS connection
 
     def request_full_state(self):
-        if ((time.time() - self.last_time_full_state_requested) > self.full_state_request_timeout):
+        # Use the monotonic clock for the request timeout so wall-clock adjustments (NTP syncs, DST...)
+        # can't spuriously expire or extend it
+        if ((time.monotonic() - self.last_time_full_state_requested) > self.full_state_request_timeout):
             # If full state has not returned for a while, ask again
             self.full_state_requested = False
 
@@ -207,15 +334,36 @@ class StateSynchronizer(object):
             if self.verbose_level >= 2:
                 print('* Requesting full state')
             self.full_state_requested = True
-            self.last_time_full_state_requested = time.time()
+            self.last_time_full_state_requested = time.monotonic()
             self.send_msg_to_app('/get_state', ["full"])
 
     def set_full_state(self, update_id, full_state_raw):
+        # Called from the WS reader thread. Parsing the full state XML and rebuilding the object tree is
+        # expensive and would delay reading the next frames from the socket, so hand the raw state to the
+        # worker thread instead. Incremental updates travel through the same inbox so state messages are
+        # applied in exactly the order they arrived; the worker still coalesces pending full states
+        # (a newer snapshot supersedes everything queued before it)
+        self.state_message_inbox.put(('full_state', update_id, full_state_raw))
+
+    def set_state_update(self, update_id, update_type, update_data):
+        # Called from the WS reader thread; applied by the worker thread in arrival order (see
+        # set_full_state for why state messages all funnel through the same inbox)
+        self.state_message_inbox.put(('state_update', update_id, update_type, update_data))
+
+    def apply_full_state(self, update_id, full_state_raw):
         if self.verbose_level >= 2:
             print("Receiving full state with update id {}".format(update_id))
+        full_state_hash = hash(full_state_raw)
+        if full_state_hash == self.last_full_state_hash:
+            # The received state is identical to the one we already applied, skip the expensive XML
+            # parsing/object building step
+            self.full_state_requested = False
+            self.should_request_full_state = False
+            return
         full_state_soup = BeautifulSoup(full_state_raw, "lxml")
         self.full_state_requested = False
         self.should_request_full_state = False
+        self.last_full_state_hash = full_state_hash
         self.on_full_state_received(full_state_soup)
 
     def apply_update(self, update_id, update_type, update_data):
@@ -228,7 +376,7 @@ class StateSynchronizer(object):
             if self.verbose_level >= 2:
                 print('WARNING: last_update_id does not match with received update ({} vs {})'
                       .format(self.last_update_id + 1, update_id))
-            self.should_request_full_state = True
+            self.trigger_full_state_resync()
         self.last_update_id = update_id
     
     def on_state_update(self, update_type, update_data):